@@ -80,7 +80,7 @@ class ColorChooser(ttk.Frame):
         self.luminance_scale.pack(fill=X)
         self.notebook.add(spectrum_frame, text=MessageCatalog.translate('Advanced'))
 
-        themed_colors = [self.colors.get(c) for c in self.style.colors]
+        themed_colors = [color for _, color in self.colors.items()]
         self.themed_swatches = self.create_swatches(
             self.notebook, themed_colors)
         self.standard_swatches = self.create_swatches(
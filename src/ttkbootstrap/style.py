@@ -3,9 +3,10 @@ import colorsys
 import tkinter as tk
 from tkinter import font
 from math import ceil
+from functools import lru_cache
 from tkinter import TclError, ttk
 from typing import Any, Callable
-from PIL import ImageTk, ImageDraw, Image, ImageFont
+from PIL import ImageTk, ImageDraw, Image, ImageFont, ImageChops
 from ttkbootstrap.constants import *
 from ttkbootstrap.themes.standard import STANDARD_THEMES
 from ttkbootstrap.publisher import Publisher, Channel
@@ -49,6 +50,10 @@ class Colors:
         for color_label in style.colors:
             color = style.colors.get(color_label)
             print(color_label, color)
+
+        # or iterate over the labels and colors together
+        for color_label, color in style.colors.items():
+            print(color_label, color)
         ```
 
         If, for some reason, you need to iterate over all theme color
@@ -71,6 +76,27 @@ class Colors:
         ```
     """
 
+    _accent_labels = (
+        "primary",
+        "secondary",
+        "success",
+        "info",
+        "warning",
+        "danger",
+        "light",
+        "dark",
+    )
+    _labels = _accent_labels + (
+        "bg",
+        "fg",
+        "selectbg",
+        "selectfg",
+        "border",
+        "inputfg",
+        "inputbg",
+        "active",
+    )
+
     def __init__(
         self,
         primary,
@@ -159,6 +185,7 @@ class Colors:
         self.active = active
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def make_transparent(alpha, foreground, background='#ffffff'):
         """Simulate color transparency.
         
@@ -184,7 +211,7 @@ class Colors:
         bg = ImageColor.getrgb(background)
         rgb_float = [alpha * c1 + (1 - alpha) * c2 for (c1, c2) in zip(fg, bg)]
         rgb_int = [int(x) for x in rgb_float]
-        return '#{:02x}{:02x}{:02x}'.format(*rgb_int)    
+        return '#{:02x}{:02x}{:02x}'.format(*rgb_int)
 
     @staticmethod
     def rgb_to_hsv(r, g, b):
@@ -249,19 +276,20 @@ class Colors:
         """
         self.__dict__[color_label] = color_value
 
+    def items(self):
+        """Iterate over the main style color labels and their color
+        values, in the same order as iterating over the object.
+
+        Returns:
+
+            iter:
+                An iterator of (color label, color value) tuples.
+        """
+        colors = self.__dict__
+        return ((label, colors[label]) for label in Colors._accent_labels)
+
     def __iter__(self):
-        return iter(
-            [
-                "primary",
-                "secondary",
-                "success",
-                "info",
-                "warning",
-                "danger",
-                "light",
-                "dark",
-            ]
-        )
+        return iter(Colors._accent_labels)
 
     def __repr__(self):
         out = tuple(zip(self.__dict__.keys(), self.__dict__.values()))
@@ -276,28 +304,10 @@ class Colors:
             iter:
                 An iterator for color label names
         """
-        return iter(
-            [
-                "primary",
-                "secondary",
-                "success",
-                "info",
-                "warning",
-                "danger",
-                "light",
-                "dark",
-                "bg",
-                "fg",
-                "selectbg",
-                "selectfg",
-                "border",
-                "inputfg",
-                "inputbg",
-                "active",
-            ]
-        )
+        return iter(Colors._labels)
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def hex_to_rgb(color: str):
         """Convert hexadecimal color to rgb color value
 
@@ -311,7 +321,13 @@ class Colors:
             tuple[int, int, int]:
                 An rgb color value.
         """
-        r, g, b = colorutils.color_to_rgb(color)
+        if len(color) == 7 and color[0] == "#":
+            # already a hex color; no need to resolve the color spec
+            r = int(color[1:3], 16)
+            g = int(color[3:5], 16)
+            b = int(color[5:7], 16)
+        else:
+            r, g, b = colorutils.color_to_rgb(color)
         return r/255, g/255, b/255
 
     @staticmethod
@@ -337,9 +353,10 @@ class Colors:
         r_ = int(r * 255)
         g_ = int(g * 255)
         b_ = int(b * 255)
-        return colorutils.color_to_hex((r_, g_, b_))
+        return f"#{r_:02x}{g_:02x}{b_:02x}"
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def update_hsv(color, hd=0, sd=0, vd=0):
         """Modify the hue, saturation, and/or value of a given hex
         color value by specifying the _delta_.
@@ -398,6 +415,8 @@ class ThemeDefinition:
     """A class to provide defined name, colors, and font settings for a
     ttkbootstrap theme."""
 
+    __slots__ = ("name", "colors", "type")
+
     def __init__(self, name, colors, themetype=LIGHT):
         """
         Parameters:
@@ -472,13 +491,17 @@ class Style(ttk.Style):
             if theme != DEFAULT_THEME:
                 Style.instance.theme_use(theme)
             return
+        self.theme = None
+        self._theme_signatures = {}  # colors each theme was applied with
         self._theme_objects = {}
         self._theme_definitions = {}
         self._style_registry = set()  # all styles used
         self._theme_styles = {}  # styles used in theme
         self._theme_names = set()
+        self._image_assets = {}  # image assets shared by all themes
         self._load_themes()
         super().__init__()
+        self._known_themes = set(super().theme_names())
 
         Style.instance = self
         self.theme_use(theme)
@@ -497,15 +520,11 @@ class Style(ttk.Style):
             Colors:
                 The colors object for the current theme.
         """
-        theme = self.theme.name
-        if theme in list(self._theme_names):
-            definition = self._theme_definitions.get(theme)
-            if not definition:
-                return []  # TODO refactor this
-            else:
-                return definition.colors
-        else:
+        definition = self._theme_definitions.get(self.theme.name)
+        if not definition:
             return []  # TODO refactor this
+        else:
+            return definition.colors
 
     def configure(self, style, query_opt: Any = None, **kw):
         if query_opt:
@@ -556,7 +575,10 @@ class Style(ttk.Style):
 
         If themename is None, returns the theme in use, otherwise, set
         the current theme to themename, refreshes all widgets and emits
-        a ``<<ThemeChanged>>`` event.
+        a ``<<ThemeChanged>>`` event. Selecting the theme that is already
+        in use only refreshes the legacy tkinter widgets, unless its
+        colors have changed. Styles that already exist are not rebuilt
+        for the new colors; styles built afterwards use them.
 
         Only use this method if you are changing the theme *during*
         runtime. Otherwise, pass the theme name into the Style
@@ -577,21 +599,80 @@ class Style(ttk.Style):
             # return current theme
             return super().theme_use()
 
+        # skip when the theme is already in use with the same colors
+        definition = self._theme_definitions.get(themename)
+        signature = None
+        if definition is not None:
+            signature = self._theme_signature(definition)
+        if (
+            definition is not None
+            and definition is self.theme
+            and signature == self._theme_signatures.get(themename)
+            and super().theme_use() == themename
+        ):
+            # still restyle the legacy tk widgets
+            Publisher.publish_message(Channel.STD)
+            return
+
+        # themes created outside of `theme_create`, e.g. a sourced tcl
+        # theme file, are only found by querying tcl
+        if themename not in self._known_themes:
+            self._known_themes.update(super().theme_names())
+
         # change to an existing theme
-        existing_themes = super().theme_names()
-        if themename in existing_themes:
-            self.theme = self._theme_definitions.get(themename)
+        if themename in self._known_themes:
+            self.theme = definition
             super().theme_use(themename)
             self._create_ttk_styles_on_theme_change()
             Publisher.publish_message(Channel.STD)
         # setup a new theme
         elif themename in self._theme_names:
-            self.theme = self._theme_definitions.get(themename)
+            self.theme = definition
             self._theme_objects[themename] = StyleBuilderTTK()
             self._create_ttk_styles_on_theme_change()
             Publisher.publish_message(Channel.STD)
         else:
             raise TclError(themename, "is not a valid theme.")
+        if signature is not None:
+            self._theme_signatures[themename] = signature
+
+    @staticmethod
+    def _theme_signature(definition):
+        """The values that determine how a theme is applied. Colors can
+        be changed in place with `Colors.set`, so they are included in
+        addition to the name and type.
+
+        Parameters:
+
+            definition (ThemeDefinition):
+                The theme definition.
+
+        Returns:
+
+            Tuple:
+                A tuple that compares equal for identical themes.
+        """
+        colors = tuple(vars(definition.colors).items())
+        return definition.name, definition.type, colors
+
+    def theme_create(self, themename, parent=None, settings=None):
+        """Creates a new theme. The theme name is also added to the
+        set of known themes so that `theme_use` does not need to query
+        tcl for the existing theme names.
+
+        Parameters:
+
+            themename (str):
+                The name of the new theme.
+
+            parent (str):
+                The name of the theme to inherit from.
+
+            settings (Dict):
+                The theme settings to apply.
+        """
+        super().theme_create(themename, parent, settings)
+        self._known_themes.add(themename)
 
     def style_exists_in_theme(self, ttkstyle: str):
         """Check if a style exists in the current theme.
@@ -656,8 +737,7 @@ class Style(ttk.Style):
         # at run-time
         if USER_THEMES:
             STANDARD_THEMES.update(USER_THEMES)
-        theme_settings = {"themes": STANDARD_THEMES}
-        for name, definition in theme_settings["themes"].items():
+        for name, definition in STANDARD_THEMES.items():
             self.register_theme(
                 ThemeDefinition(
                     name=name,
@@ -682,11 +762,15 @@ class Style(ttk.Style):
 
     def _create_ttk_styles_on_theme_change(self):
         """Create existing styles when the theme changes"""
+        if self.theme is None:
+            # not a ttkbootstrap theme
+            return
+        builder: StyleBuilderTTK = self._get_builder()
+        theme_styles = self._theme_styles[self.theme.name]
         for ttkstyle in self._style_registry:
-            if not self.style_exists_in_theme(ttkstyle):
+            if ttkstyle not in theme_styles:
                 color = Bootstyle.ttkstyle_widget_color(ttkstyle)
                 method_name = Bootstyle.ttkstyle_method_name(string=ttkstyle)
-                builder: StyleBuilderTTK = self._get_builder()
                 method: Callable = builder.name_to_method(method_name)
                 method(builder, color)
 
@@ -729,6 +813,15 @@ class StyleBuilderTK:
         """Returns `True` if the theme is _light_, otherwise `False`."""
         return self.style.theme.type == LIGHT
 
+    @property
+    def bordercolor(self) -> str:
+        """The border color shared by the input and container widgets
+        of the current theme."""
+        if self.is_light_theme:
+            return self.colors.border
+        else:
+            return self.colors.selectbg
+
     def update_tk_style(self, widget: tk.Tk):
         """Update the window style.
 
@@ -778,9 +871,10 @@ class StyleBuilderTK:
             widget (tkinter.Button):
                 The button object to update.
         """
-        background = self.colors.primary
-        foreground = self.colors.selectfg
-        activebackground = Colors.update_hsv(self.colors.primary, vd=-0.1)
+        colors = self.colors
+        background = colors.primary
+        foreground = colors.selectfg
+        activebackground = Colors.update_hsv(colors.primary, vd=-0.1)
 
         widget.configure(
             background=background,
@@ -788,7 +882,7 @@ class StyleBuilderTK:
             relief=tk.FLAT,
             borderwidth=0,
             activebackground=activebackground,
-            highlightbackground=self.colors.selectfg,
+            highlightbackground=colors.selectfg,
         )
 
     def update_label_style(self, widget: tk.Label):
@@ -799,7 +893,8 @@ class StyleBuilderTK:
             widget (tkinter.Label):
                 The label object to update.
         """
-        widget.configure(foreground=self.colors.fg, background=self.colors.bg)
+        colors = self.colors
+        widget.configure(foreground=colors.fg, background=colors.bg)
 
     def update_frame_style(self, widget: tk.Frame):
         """Update the frame style.
@@ -819,12 +914,13 @@ class StyleBuilderTK:
             widget (tkinter.Checkbutton):
                 The checkbutton object to update.
         """
+        colors = self.colors
         widget.configure(
-            activebackground=self.colors.bg,
-            activeforeground=self.colors.primary,
-            background=self.colors.bg,
-            foreground=self.colors.fg,
-            selectcolor=self.colors.bg,
+            activebackground=colors.bg,
+            activeforeground=colors.primary,
+            background=colors.bg,
+            foreground=colors.fg,
+            selectcolor=colors.bg,
         )
 
     def update_radiobutton_style(self, widget: tk.Radiobutton):
@@ -835,12 +931,13 @@ class StyleBuilderTK:
             widget (tkinter.Radiobutton):
                 The radiobutton object to update.
         """
+        colors = self.colors
         widget.configure(
-            activebackground=self.colors.bg,
-            activeforeground=self.colors.primary,
-            background=self.colors.bg,
-            foreground=self.colors.fg,
-            selectcolor=self.colors.bg,
+            activebackground=colors.bg,
+            activeforeground=colors.primary,
+            background=colors.bg,
+            foreground=colors.fg,
+            selectcolor=colors.bg,
         )
 
     def update_entry_style(self, widget: tk.Entry):
@@ -851,19 +948,16 @@ class StyleBuilderTK:
             widget (tkinter.Entry):
                 The entry object to update.
         """
-        if self.is_light_theme:
-            bordercolor = self.colors.border
-        else:
-            bordercolor = self.colors.selectbg
-
+        colors = self.colors
+        bordercolor = self.bordercolor
         widget.configure(
             relief=tk.FLAT,
             highlightthickness=1,
-            foreground=self.colors.inputfg,
+            foreground=colors.inputfg,
             highlightbackground=bordercolor,
-            highlightcolor=self.colors.primary,
-            background=self.colors.inputbg,
-            insertbackground=self.colors.inputfg,
+            highlightcolor=colors.primary,
+            background=colors.inputbg,
+            insertbackground=colors.inputfg,
             insertwidth=1,
         )
 
@@ -875,14 +969,11 @@ class StyleBuilderTK:
             widget (tkinter.scale):
                 The scale object to update.
         """
-        if self.is_light_theme:
-            bordercolor = self.colors.border
-        else:
-            bordercolor = self.colors.selectbg
-
-        activecolor = Colors.update_hsv(self.colors.primary, vd=-0.2)
+        colors = self.colors
+        bordercolor = self.bordercolor
+        activecolor = Colors.update_hsv(colors.primary, vd=-0.2)
         widget.configure(
-            background=self.colors.primary,
+            background=colors.primary,
             showvalue=False,
             sliderrelief=tk.FLAT,
             borderwidth=0,
@@ -890,7 +981,7 @@ class StyleBuilderTK:
             highlightthickness=1,
             highlightcolor=bordercolor,
             highlightbackground=bordercolor,
-            troughcolor=self.colors.inputbg,
+            troughcolor=colors.inputbg,
         )
 
     def update_spinbox_style(self, widget: tk.Spinbox):
@@ -901,20 +992,17 @@ class StyleBuilderTK:
             widget (tkinter.Spinbox):
                 THe spinbox object to update.
         """
-        if self.is_light_theme:
-            bordercolor = self.colors.border
-        else:
-            bordercolor = self.colors.selectbg
-
+        colors = self.colors
+        bordercolor = self.bordercolor
         widget.configure(
             relief=tk.FLAT,
             highlightthickness=1,
-            foreground=self.colors.inputfg,
+            foreground=colors.inputfg,
             highlightbackground=bordercolor,
-            highlightcolor=self.colors.primary,
-            background=self.colors.inputbg,
-            buttonbackground=self.colors.inputbg,
-            insertbackground=self.colors.inputfg,
+            highlightcolor=colors.primary,
+            background=colors.inputbg,
+            buttonbackground=colors.inputbg,
+            insertbackground=colors.inputfg,
             insertwidth=1,
             # these options should work, but do not have any affect
             buttonuprelief=tk.FLAT,
@@ -929,17 +1017,14 @@ class StyleBuilderTK:
             widget (tkinter.Listbox):
                 The listbox object to update.
         """
-        if self.is_light_theme:
-            bordercolor = self.colors.border
-        else:
-            bordercolor = self.colors.selectbg
-
+        colors = self.colors
+        bordercolor = self.bordercolor
         widget.configure(
-            foreground=self.colors.inputfg,
-            background=self.colors.inputbg,
-            selectbackground=self.colors.selectbg,
-            selectforeground=self.colors.selectfg,
-            highlightcolor=self.colors.primary,
+            foreground=colors.inputfg,
+            background=colors.inputbg,
+            selectbackground=colors.selectbg,
+            selectforeground=colors.selectfg,
+            highlightcolor=colors.primary,
             highlightbackground=bordercolor,
             highlightthickness=1,
             activestyle="none",
@@ -954,12 +1039,13 @@ class StyleBuilderTK:
             widget (tkinter.Menubutton):
                 The menubutton object to update.
         """
-        activebackground = Colors.update_hsv(self.colors.primary, vd=-0.2)
+        colors = self.colors
+        activebackground = Colors.update_hsv(colors.primary, vd=-0.2)
         widget.configure(
-            background=self.colors.primary,
-            foreground=self.colors.selectfg,
+            background=colors.primary,
+            foreground=colors.selectfg,
             activebackground=activebackground,
-            activeforeground=self.colors.selectfg,
+            activeforeground=colors.selectfg,
             borderwidth=0,
         )
 
@@ -971,13 +1057,14 @@ class StyleBuilderTK:
             widget (tkinter.Menu):
                 The menu object to update.
         """
+        colors = self.colors
         widget.configure(
             tearoff=False,
-            activebackground=self.colors.selectbg,
-            activeforeground=self.colors.selectfg,
-            foreground=self.colors.fg,
-            selectcolor=self.colors.primary,
-            background=self.colors.bg,
+            activebackground=colors.selectbg,
+            activeforeground=colors.selectfg,
+            foreground=colors.fg,
+            selectcolor=colors.primary,
+            background=colors.bg,
             relief=tk.FLAT,
             borderwidth=0,
         )
@@ -990,17 +1077,14 @@ class StyleBuilderTK:
             widget (tkinter.LabelFrame):
                 The labelframe object to update.
         """
-        if self.is_light_theme:
-            bordercolor = self.colors.border
-        else:
-            bordercolor = self.colors.selectbg
-
+        colors = self.colors
+        bordercolor = self.bordercolor
         widget.configure(
             highlightcolor=bordercolor,
-            foreground=self.colors.fg,
+            foreground=colors.fg,
             borderwidth=1,
             highlightthickness=0,
-            background=self.colors.bg,
+            background=colors.bg,
         )
 
     def update_text_style(self, widget: tk.Text):
@@ -1011,24 +1095,21 @@ class StyleBuilderTK:
             widget (tkinter.Text):
                 The text object to update.
         """
-        if self.is_light_theme:
-            bordercolor = self.colors.border
-        else:
-            bordercolor = self.colors.selectbg
-
+        colors = self.colors
+        bordercolor = self.bordercolor
         focuscolor = widget.cget("highlightbackground")
 
         if focuscolor in ["SystemButtonFace", bordercolor]:
             focuscolor = bordercolor
 
         widget.configure(
-            background=self.colors.inputbg,
-            foreground=self.colors.inputfg,
+            background=colors.inputbg,
+            foreground=colors.inputfg,
             highlightcolor=focuscolor,
             highlightbackground=bordercolor,
-            insertbackground=self.colors.inputfg,
-            selectbackground=self.colors.selectbg,
-            selectforeground=self.colors.selectfg,
+            insertbackground=colors.inputfg,
+            selectbackground=colors.selectbg,
+            selectforeground=colors.selectfg,
             insertwidth=1,
             highlightthickness=1,
             relief=tk.FLAT,
@@ -1051,6 +1132,7 @@ class StyleBuilderTTK:
         self.style: Style = Style.get_instance()
         self.theme_images = {}
         self.builder_tk = StyleBuilderTK()
+        self.winsys = self.style.tk.call("tk", "windowingsystem")
         self.create_theme()
 
     @staticmethod
@@ -1087,6 +1169,54 @@ class StyleBuilderTTK:
         returns `False`."""
         return self.style.theme.type == LIGHT
 
+    @property
+    def bordercolor(self) -> str:
+        """The border color shared by the input and container widgets
+        of the current theme."""
+        if self.is_light_theme:
+            return self.colors.border
+        else:
+            return self.colors.selectbg
+
+    @property
+    def troughcolor(self) -> str:
+        """The trough color shared by the progressbar, scale,
+        scrollbar, and meter styles of the current theme."""
+        if self.is_light_theme:
+            return self.colors.light
+        else:
+            return Colors.update_hsv(self.colors.selectbg, vd=-0.2)
+
+    @property
+    def disabled_fg(self) -> str:
+        """The foreground of disabled widgets; the theme foreground at
+        30% over the background."""
+        colors = self.colors
+        return Colors.make_transparent(0.30, colors.fg, colors.bg)
+
+    @property
+    def disabled_bg(self) -> str:
+        """The background of disabled widgets; the theme foreground at
+        10% over the background."""
+        colors = self.colors
+        return Colors.make_transparent(0.10, colors.fg, colors.bg)
+
+    @property
+    def off_border(self) -> str:
+        """The border of toggles, checkbuttons, and radiobuttons in the
+        off state; the theme foreground at 40% over the background."""
+        colors = self.colors
+        return Colors.make_transparent(0.40, colors.fg, colors.bg)
+
+    @property
+    def input_disabled_fg(self) -> str:
+        """The foreground of disabled input widgets; a darker shade of
+        the input background."""
+        if self.is_light_theme:
+            return Colors.update_hsv(self.colors.inputbg, vd=-0.2)
+        else:
+            return Colors.update_hsv(self.colors.inputbg, vd=-0.3)
+
     def scale_size(self, size):
         """Scale the size of images and other assets based on the
         scaling factor of ttk to ensure that the image matches the
@@ -1097,8 +1227,7 @@ class StyleBuilderTTK:
             size (Union[int, List, Tuple]):
                 A single integer or an iterable of integers
         """
-        winsys = self.style.master.tk.call("tk", "windowingsystem")
-        if winsys == "aqua":
+        if self.winsys == "aqua":
             BASELINE = 1.000492368291482
         else:
             BASELINE = 1.33398982438864281
@@ -1110,6 +1239,74 @@ class StyleBuilderTTK:
         elif isinstance(size, tuple) or isinstance(size, list):
             return [ceil(x * factor) for x in size]
 
+    def create_solid_image(self, size, color):
+        """Create a solid color image with the native tkinter
+        PhotoImage. This avoids the overhead of building and converting
+        a PIL image when the asset is a single fill color.
+
+        Parameters:
+
+            size (Union[List, Tuple]):
+                The width and height of the image.
+
+            color (str):
+                The fill color of the image.
+
+        Returns:
+
+            str:
+                The name of the PhotoImage.
+        """
+        width, height = size
+        key = ("solid", width, height, color)
+        names = self.get_cached_assets(key)
+        if names:
+            return names[0]
+
+        img = tk.PhotoImage(
+            master=self.style.master, width=width, height=height
+        )
+        img.put(color, to=(0, 0, width, height))
+        name = img.name
+        self.theme_images[name] = img
+        self.cache_assets(key, name)
+        return name
+
+    def get_cached_assets(self, key):
+        """Get the image names previously created for `key` by any
+        theme. Image assets are determined entirely by their colors and
+        sizes, so themes that share a color can share the same images.
+
+        Parameters:
+
+            key (Tuple):
+                The asset type and every value used to draw the assets.
+
+        Returns:
+
+            Union[Tuple[str, ...], None]:
+                The image names, or `None` if the assets do not exist.
+        """
+        assets = self.style._image_assets.get(key)
+        if assets:
+            return assets[0]
+
+    def cache_assets(self, key, *names):
+        """Share the images in `theme_images` identified by `names` with
+        all themes under `key`. A reference to each image is kept with
+        the cache so the images stay alive as long as the style.
+
+        Parameters:
+
+            key (Tuple):
+                The asset type and every value used to draw the assets.
+
+            *names (str):
+                The names of the images to cache.
+        """
+        images = tuple(self.theme_images[name] for name in names)
+        self.style._image_assets[key] = (names, images)
+
     def create_theme(self):
         """Create and style a new ttk theme. A wrapper around internal
         style methods.
@@ -1159,16 +1356,14 @@ class StyleBuilderTTK:
         """
         STYLE = "TCombobox"
 
+        disabled_fg = self.bordercolor
+        bordercolor = self.bordercolor
         if self.is_light_theme:
-            disabled_fg = self.colors.border
-            bordercolor = self.colors.border
             readonly = self.colors.light
         else:
-            disabled_fg = self.colors.selectbg
-            bordercolor = self.colors.selectbg
             readonly = bordercolor
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             element = f"{ttkstyle.replace('TC','C')}"
             focuscolor = self.colors.primary
@@ -1181,7 +1376,7 @@ class StyleBuilderTTK:
         self.style.element_create(f"{element}.padding", "from", TTK_CLAM)
         self.style.element_create(f"{element}.textarea", "from", TTK_CLAM)
 
-        if all([colorname, colorname != DEFAULT]):
+        if colorname and colorname != DEFAULT:
             bordercolor = focuscolor
 
         self.style._build_configure(
@@ -1198,28 +1393,26 @@ class StyleBuilderTTK:
             padding=5,
             arrowsize=self.scale_size(12),
         )
+        # the same state lists are used for several options
+        readonly_map = (("readonly", readonly),)
+        focus_map = (
+            ("focus invalid", self.colors.danger),
+            ("focus !disabled", focuscolor),
+            ("pressed !disabled", focuscolor),
+            ("readonly", readonly),
+        )
         self.style.map(
             ttkstyle,
-            background=[("readonly", readonly)],
-            fieldbackground=[("readonly", readonly)],
+            background=readonly_map,
+            fieldbackground=readonly_map,
             foreground=[("disabled", disabled_fg)],
             bordercolor=[
                 ("invalid", self.colors.danger),
                 ("focus !disabled", focuscolor),
                 ("hover !disabled", focuscolor),
             ],
-            lightcolor=[
-                ("focus invalid", self.colors.danger),
-                ("focus !disabled", focuscolor),
-                ("pressed !disabled", focuscolor),
-                ("readonly", readonly),
-            ],
-            darkcolor=[
-                ("focus invalid", self.colors.danger),
-                ("focus !disabled", focuscolor),
-                ("pressed !disabled", focuscolor),
-                ("readonly", readonly),
-            ],
+            lightcolor=focus_map,
+            darkcolor=focus_map,
             arrowcolor=[
                 ("disabled", disabled_fg),
                 ("pressed !disabled", focuscolor),
@@ -1275,12 +1468,9 @@ class StyleBuilderTTK:
         vsize = [1, 40]
 
         # style colors
-        if self.is_light_theme:
-            default_color = self.colors.border
-        else:
-            default_color = self.colors.selectbg
+        default_color = self.bordercolor
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             background = default_color
             h_ttkstyle = HSTYLE
             v_ttkstyle = VSTYLE
@@ -1291,10 +1481,7 @@ class StyleBuilderTTK:
 
         # horizontal separator
         h_element = h_ttkstyle.replace(".TS", ".S")
-        h_img = ImageTk.PhotoImage(Image.new("RGB", hsize, background))
-        h_name = util.get_image_name(h_img)
-        self.theme_images[h_name] = h_img
-
+        h_name = self.create_solid_image(hsize, background)
         self.style.element_create(f"{h_element}.separator", "image", h_name)
         self.style.layout(
             h_ttkstyle, [(f"{h_element}.separator", {"sticky": tk.EW})]
@@ -1302,9 +1489,7 @@ class StyleBuilderTTK:
 
         # vertical separator
         v_element = v_ttkstyle.replace(".TS", ".S")
-        v_img = ImageTk.PhotoImage(Image.new("RGB", vsize, background))
-        v_name = util.get_image_name(v_img)
-        self.theme_images[v_name] = v_img
+        v_name = self.create_solid_image(vsize, background)
         self.style.element_create(f"{v_element}.separator", "image", v_name)
         self.style.layout(
             v_ttkstyle, [(f"{v_element}.separator", {"sticky": tk.NS})]
@@ -1312,6 +1497,30 @@ class StyleBuilderTTK:
         self.style._register_ttkstyle(h_ttkstyle)
         self.style._register_ttkstyle(v_ttkstyle)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def striped_progressbar_mask(thickness):
+        """Create the mask of the diagonal stripe used by the striped
+        progressbar. The pattern does not depend on the theme, so it
+        is drawn and resampled once per thickness and shared by all
+        colors.
+
+        Parameters:
+
+            thickness (int):
+                The width and height of the mask.
+
+        Returns:
+
+            Image:
+                A grayscale image where the stripe is opaque.
+        """
+        mask = Image.new("L", (100, 100))
+        draw = ImageDraw.Draw(mask)
+        draw.polygon(xy=[(0, 0), (48, 0), (100, 52), (100, 100)], fill=255)
+        draw.polygon(xy=[(0, 52), (48, 100), (0, 100)], fill=255)
+        return mask.resize((thickness, thickness), Image.LANCZOS)
+
     def create_striped_progressbar_assets(self, thickness, colorname=DEFAULT):
         """Create the striped progressbar image and return as a
         `PhotoImage`
@@ -1326,13 +1535,19 @@ class StyleBuilderTTK:
             Tuple[str]:
                 A list of photoimage names.
         """
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             barcolor = self.colors.primary
         else:
             barcolor = self.colors.get(colorname)
 
-        # calculate value of the light color
-        brightness = Colors.rgb_to_hsv(*Colors.hex_to_rgb(barcolor))[2]
+        key = ("striped", thickness, barcolor)
+        names = self.get_cached_assets(key)
+        if names:
+            return names
+
+        # calculate value of the light color; the hsv value of a color
+        # is its largest rgb component
+        brightness = max(Colors.hex_to_rgb(barcolor))
         if brightness < 0.4:
             value_delta = 0.3
         elif brightness > 0.8:
@@ -1343,22 +1558,17 @@ class StyleBuilderTTK:
         barcolor_light = Colors.update_hsv(barcolor, sd=-0.2, vd=value_delta)
 
         # horizontal progressbar
-        img = Image.new("RGBA", (100, 100), barcolor_light)
-        draw = ImageDraw.Draw(img)
-        draw.polygon(
-            xy=[(0, 0), (48, 0), (100, 52), (100, 100)],
-            fill=barcolor,
-        )
-        draw.polygon(xy=[(0, 52), (48, 100), (0, 100)], fill=barcolor)
+        img = Image.new("RGBA", (thickness, thickness), barcolor_light)
+        img.paste(barcolor, mask=self.striped_progressbar_mask(thickness))
 
-        _resized = img.resize((thickness, thickness), Image.LANCZOS)
-        h_img = ImageTk.PhotoImage(_resized)
+        h_img = ImageTk.PhotoImage(img)
         h_name = h_img._PhotoImage__photo.name
-        v_img = ImageTk.PhotoImage(_resized.rotate(90))
+        v_img = ImageTk.PhotoImage(img.rotate(90))
         v_name = v_img._PhotoImage__photo.name
 
         self.theme_images[h_name] = h_img
         self.theme_images[v_name] = v_img
+        self.cache_assets(key, h_name, v_name)
         return h_name, v_name
 
     def create_striped_progressbar_style(self, colorname=DEFAULT):
@@ -1374,7 +1584,7 @@ class StyleBuilderTTK:
 
         thickness = self.scale_size(12)
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             h_ttkstyle = HSTYLE
             v_ttkstyle = VSTYLE
         else:
@@ -1389,12 +1599,20 @@ class StyleBuilderTTK:
                 troughcolor = self.colors.light
                 bordercolor = troughcolor
         else:
-            troughcolor = Colors.update_hsv(self.colors.selectbg, vd=-0.2)
+            troughcolor = self.troughcolor
             bordercolor = troughcolor
 
         # ( horizontal, vertical )
         images = self.create_striped_progressbar_assets(thickness, colorname)
 
+        # both orientations use the same settings
+        settings = dict(
+            troughcolor=troughcolor,
+            thickness=thickness,
+            bordercolor=bordercolor,
+            borderwidth=1,
+        )
+
         # horizontal progressbar
         h_element = h_ttkstyle.replace(".TP", ".P")
         self.style.element_create(
@@ -1421,13 +1639,7 @@ class StyleBuilderTTK:
                 )
             ],
         )
-        self.style._build_configure(
-            h_ttkstyle,
-            troughcolor=troughcolor,
-            thickness=thickness,
-            bordercolor=bordercolor,
-            borderwidth=1,
-        )
+        self.style._build_configure(h_ttkstyle, **settings)
 
         # vertical progressbar
         v_element = v_ttkstyle.replace(".TP", ".P")
@@ -1455,13 +1667,7 @@ class StyleBuilderTTK:
                 )
             ],
         )
-        self.style._build_configure(
-            v_ttkstyle,
-            troughcolor=troughcolor,
-            bordercolor=bordercolor,
-            thickness=thickness,
-            borderwidth=1,
-        )
+        self.style._build_configure(v_ttkstyle, **settings)
         self.style._register_ttkstyle(h_ttkstyle)
         self.style._register_ttkstyle(v_ttkstyle)
 
@@ -1486,10 +1692,10 @@ class StyleBuilderTTK:
                 troughcolor = self.colors.light
                 bordercolor = troughcolor
         else:
-            troughcolor = Colors.update_hsv(self.colors.selectbg, vd=-0.2)
+            troughcolor = self.troughcolor
             bordercolor = troughcolor
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             background = self.colors.primary
             h_ttkstyle = H_STYLE
             v_ttkstyle = V_STYLE
@@ -1498,26 +1704,18 @@ class StyleBuilderTTK:
             h_ttkstyle = f"{colorname}.{H_STYLE}"
             v_ttkstyle = f"{colorname}.{V_STYLE}"
 
-        self.style._build_configure(
-            h_ttkstyle,
-            thickness=thickness,
-            borderwidth=1,
-            bordercolor=bordercolor,
-            lightcolor=self.colors.border,
-            pbarrelief=tk.FLAT,
-            troughcolor=troughcolor,
-        )
-        existing_elements = self.style.element_names()
-
-        self.style._build_configure(
-            v_ttkstyle,
+        # both orientations use the same settings
+        settings = dict(
             thickness=thickness,
             borderwidth=1,
             bordercolor=bordercolor,
             lightcolor=self.colors.border,
             pbarrelief=tk.FLAT,
             troughcolor=troughcolor,
+            background=background,
         )
+        self.style._build_configure(h_ttkstyle, **settings)
+        self.style._build_configure(v_ttkstyle, **settings)
         existing_elements = self.style.element_names()
 
         # horizontal progressbar
@@ -1542,7 +1740,6 @@ class StyleBuilderTTK:
                 )
             ],
         )
-        self.style._build_configure(h_ttkstyle, background=background)
 
         # vertical progressbar
         v_element = v_ttkstyle.replace(".TP", ".P")
@@ -1551,7 +1748,6 @@ class StyleBuilderTTK:
         if trough_element not in existing_elements:
             self.style.element_create(trough_element, "from", TTK_CLAM)
             self.style.element_create(pbar_element, "from", TTK_DEFAULT)
-            self.style._build_configure(v_ttkstyle, background=background)
         self.style.layout(
             v_ttkstyle,
             [
@@ -1571,6 +1767,54 @@ class StyleBuilderTTK:
         self.style._register_ttkstyle(h_ttkstyle)
         self.style._register_ttkstyle(v_ttkstyle)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def create_slider_mask(size):
+        """Create the alpha mask of the round slider handle used by the
+        ttk.Scale widget. The circle is drawn at a large size and
+        downsampled for a smooth edge. The shape is the same for every
+        color, so this is done only once per size.
+
+        Parameters:
+
+            size (int):
+                The diameter of the slider in pixels.
+
+        Returns:
+
+            Image:
+                A grayscale image where the slider is opaque.
+        """
+        mask = Image.new("L", (100, 100))
+        draw = ImageDraw.Draw(mask)
+        draw.ellipse((0, 0, 95, 95), fill=255)
+        return mask.resize((size, size), Image.LANCZOS)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def create_slider_image(color, size):
+        """Create the round slider handle image used by the ttk.Scale
+        widget by applying the slider mask to a solid color. The image
+        is cached by color and size and reused by every theme that
+        needs it.
+
+        Parameters:
+
+            color (str):
+                The fill color of the slider.
+
+            size (int):
+                The diameter of the slider in pixels.
+
+        Returns:
+
+            Image:
+                The slider image. It is shared, so do not modify it.
+        """
+        img = Image.new("RGBA", (size, size), color)
+        img.putalpha(StyleBuilderTTK.create_slider_mask(size))
+        return img
+
     def create_scale_assets(self, colorname=DEFAULT, size=14):
         """Create the assets used for the ttk.Scale widget.
 
@@ -1592,17 +1836,16 @@ class StyleBuilderTTK:
                 layout when building the style.
         """
         size = self.scale_size(size)
+        disabled_color = self.bordercolor
         if self.is_light_theme:
-            disabled_color = self.colors.border
             if colorname == LIGHT:
                 track_color = self.colors.bg
             else:
                 track_color = self.colors.light
         else:
-            disabled_color = self.colors.selectbg
-            track_color = Colors.update_hsv(self.colors.selectbg, vd=-0.2)
+            track_color = self.troughcolor
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             normal_color = self.colors.primary
         else:
             normal_color = self.colors.get(colorname)
@@ -1611,58 +1854,42 @@ class StyleBuilderTTK:
         hover_color = Colors.update_hsv(normal_color, vd=0.1)
 
         # normal state
-        _normal = Image.new("RGBA", (100, 100))
-        draw = ImageDraw.Draw(_normal)
-        draw.ellipse((0, 0, 95, 95), fill=normal_color)
         normal_img = ImageTk.PhotoImage(
-            _normal.resize((size, size), Image.LANCZOS)
+            self.create_slider_image(normal_color, size)
         )
         normal_name = util.get_image_name(normal_img)
         self.theme_images[normal_name] = normal_img
 
         # pressed state
-        _pressed = Image.new("RGBA", (100, 100))
-        draw = ImageDraw.Draw(_pressed)
-        draw.ellipse((0, 0, 95, 95), fill=pressed_color)
         pressed_img = ImageTk.PhotoImage(
-            _pressed.resize((size, size), Image.LANCZOS)
+            self.create_slider_image(pressed_color, size)
         )
         pressed_name = util.get_image_name(pressed_img)
         self.theme_images[pressed_name] = pressed_img
 
         # hover state
-        _hover = Image.new("RGBA", (100, 100))
-        draw = ImageDraw.Draw(_hover)
-        draw.ellipse((0, 0, 95, 95), fill=hover_color)
         hover_img = ImageTk.PhotoImage(
-            _hover.resize((size, size), Image.LANCZOS)
+            self.create_slider_image(hover_color, size)
         )
         hover_name = util.get_image_name(hover_img)
         self.theme_images[hover_name] = hover_img
 
         # disabled state
-        _disabled = Image.new("RGBA", (100, 100))
-        draw = ImageDraw.Draw(_disabled)
-        draw.ellipse((0, 0, 95, 95), fill=disabled_color)
         disabled_img = ImageTk.PhotoImage(
-            _disabled.resize((size, size), Image.LANCZOS)
+            self.create_slider_image(disabled_color, size)
         )
         disabled_name = util.get_image_name(disabled_img)
         self.theme_images[disabled_name] = disabled_img
 
         # vertical track
-        h_track_img = ImageTk.PhotoImage(
-            Image.new("RGB", self.scale_size((40, 5)), track_color)
+        h_track_name = self.create_solid_image(
+            self.scale_size((40, 5)), track_color
         )
-        h_track_name = util.get_image_name(h_track_img)
-        self.theme_images[h_track_name] = h_track_img
 
         # horizontal track
-        v_track_img = ImageTk.PhotoImage(
-            Image.new("RGB", self.scale_size((5, 40)), track_color)
+        v_track_name = self.create_solid_image(
+            self.scale_size((5, 40)), track_color
         )
-        v_track_name = util.get_image_name(v_track_img)
-        self.theme_images[v_track_name] = v_track_img
 
         return (
             normal_name,
@@ -1683,7 +1910,7 @@ class StyleBuilderTTK:
         """
         STYLE = "TScale"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             h_ttkstyle = f"Horizontal.{STYLE}"
             v_ttkstyle = f"Vertical.{STYLE}"
         else:
@@ -1771,7 +1998,7 @@ class StyleBuilderTTK:
         VSTYLE = "Vertical.TFloodgauge"
         FLOOD_FONT = "-size 14"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             h_ttkstyle = HSTYLE
             v_ttkstyle = VSTYLE
             background = self.colors.primary
@@ -1787,6 +2014,21 @@ class StyleBuilderTTK:
             troughcolor = Colors.update_hsv(background, sd=-0.3, vd=0.8)
             foreground = self.colors.selectfg
 
+        # both orientations use the same settings
+        settings = dict(
+            thickness=50,
+            borderwidth=1,
+            bordercolor=background,
+            lightcolor=background,
+            pbarrelief=tk.FLAT,
+            troughcolor=troughcolor,
+            background=background,
+            foreground=foreground,
+            justify=tk.CENTER,
+            anchor=tk.CENTER,
+            font=FLOOD_FONT,
+        )
+
         # horizontal floodgauge
         h_element = h_ttkstyle.replace(".TF", ".F")
         self.style.element_create(f"{h_element}.trough", "from", TTK_CLAM)
@@ -1806,20 +2048,7 @@ class StyleBuilderTTK:
                 )
             ],
         )
-        self.style._build_configure(
-            h_ttkstyle,
-            thickness=50,
-            borderwidth=1,
-            bordercolor=background,
-            lightcolor=background,
-            pbarrelief=tk.FLAT,
-            troughcolor=troughcolor,
-            background=background,
-            foreground=foreground,
-            justify=tk.CENTER,
-            anchor=tk.CENTER,
-            font=FLOOD_FONT,
-        )
+        self.style._build_configure(h_ttkstyle, **settings)
         # vertical floodgauge
         v_element = v_ttkstyle.replace(".TF", ".F")
         self.style.element_create(f"{v_element}.trough", "from", TTK_CLAM)
@@ -1839,20 +2068,7 @@ class StyleBuilderTTK:
                 )
             ],
         )
-        self.style._build_configure(
-            v_ttkstyle,
-            thickness=50,
-            borderwidth=1,
-            bordercolor=background,
-            lightcolor=background,
-            pbarrelief=tk.FLAT,
-            troughcolor=troughcolor,
-            background=background,
-            foreground=foreground,
-            justify=tk.CENTER,
-            anchor=tk.CENTER,
-            font=FLOOD_FONT,
-        )
+        self.style._build_configure(v_ttkstyle, **settings)
         # register ttkstyles
         self.style._register_ttkstyle(h_ttkstyle)
         self.style._register_ttkstyle(v_ttkstyle)
@@ -1916,6 +2132,35 @@ class StyleBuilderTTK:
 
         return normal_names, pressed_names, active_names
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def create_round_scrollbar_mask(width, height):
+        """Create the alpha mask of the round scrollbar thumb. The
+        rounded rectangle is drawn at 10x the size and downsampled for
+        a smooth edge. The shape is the same for every color, so this
+        is done only once per size.
+
+        Parameters:
+
+            width (int):
+                The width of the thumb.
+
+            height (int):
+                The height of the thumb.
+
+        Returns:
+
+            Image:
+                A grayscale image where the thumb is opaque.
+        """
+        x = width * 10
+        y = height * 10
+        mask = Image.new("L", (x, y))
+        draw = ImageDraw.Draw(mask)
+        radius = min([x, y]) // 2
+        draw.rounded_rectangle([0, 0, x - 1, y - 1], radius, 255)
+        return mask.resize((width, height), Image.BICUBIC)
+
     def create_round_scrollbar_assets(self, thumbcolor, pressed, active):
         """Create image assets to be used when building the round
         scrollbar style.
@@ -1935,14 +2180,15 @@ class StyleBuilderTTK:
         vsize = self.scale_size([9, 28])
         hsize = self.scale_size([28, 9])
 
+        key = ("round_scrollbar", *hsize, thumbcolor, pressed, active)
+        names = self.get_cached_assets(key)
+        if names:
+            return names
+
         def rounded_rect(size, fill):
-            x = size[0] * 10
-            y = size[1] * 10
-            img = Image.new("RGBA", (x, y))
-            draw = ImageDraw.Draw(img)
-            radius = min([x, y]) // 2
-            draw.rounded_rectangle([0, 0, x - 1, y - 1], radius, fill)
-            image = ImageTk.PhotoImage(img.resize(size, Image.BICUBIC))
+            img = Image.new("RGBA", size, fill)
+            img.putalpha(self.create_round_scrollbar_mask(*size))
+            image = ImageTk.PhotoImage(img)
             name = util.get_image_name(image)
             self.theme_images[name] = image
             return name
@@ -1956,7 +2202,7 @@ class StyleBuilderTTK:
         v_pressed_img = rounded_rect(vsize, pressed)
         v_active_img = rounded_rect(vsize, active)
 
-        return (
+        names = (
             h_normal_img,
             h_pressed_img,
             h_active_img,
@@ -1964,6 +2210,8 @@ class StyleBuilderTTK:
             v_pressed_img,
             v_active_img,
         )
+        self.cache_assets(key, *names)
+        return names
 
     def create_round_scrollbar_style(self, colorname=DEFAULT):
         """Create a round style for the ttk.Scrollbar widget.
@@ -1975,14 +2223,11 @@ class StyleBuilderTTK:
         """
         STYLE = "TScrollbar"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             h_ttkstyle = f"Round.Horizontal.{STYLE}"
             v_ttkstyle = f"Round.Vertical.{STYLE}"
 
-            if self.is_light_theme:
-                background = self.colors.border
-            else:
-                background = self.colors.selectbg
+            background = self.bordercolor
 
         else:
             h_ttkstyle = f"{colorname}.Round.Horizontal.{STYLE}"
@@ -1995,7 +2240,7 @@ class StyleBuilderTTK:
             else:
                 troughcolor = self.colors.light
         else:
-            troughcolor = Colors.update_hsv(self.colors.selectbg, vd=-0.2)
+            troughcolor = self.troughcolor
 
         pressed = Colors.update_hsv(background, vd=-0.05)
         active = Colors.update_hsv(background, vd=0.05)
@@ -2052,7 +2297,6 @@ class StyleBuilderTTK:
                 )
             ],
         )
-        self.style._build_configure(h_ttkstyle, arrowcolor=background)
         self.style.map(
             h_ttkstyle, arrowcolor=[("pressed", pressed), ("active", active)]
         )
@@ -2104,7 +2348,6 @@ class StyleBuilderTTK:
                 )
             ],
         )
-        self.style._build_configure(v_ttkstyle, arrowcolor=background)
         self.style.map(
             v_ttkstyle, arrowcolor=[("pressed", pressed), ("active", active)]
         )
@@ -2132,23 +2375,14 @@ class StyleBuilderTTK:
         vsize = self.scale_size([9, 28])
         hsize = self.scale_size([28, 9])
 
-        def draw_rect(size, fill):
-            x = size[0] * 10
-            y = size[1] * 10
-            img = Image.new("RGBA", (x, y), fill)
-            image = ImageTk.PhotoImage(img.resize(size), Image.BICUBIC)
-            name = util.get_image_name(image)
-            self.theme_images[name] = image
-            return name
-
-        # create images
-        h_normal_img = draw_rect(hsize, thumbcolor)
-        h_pressed_img = draw_rect(hsize, pressed)
-        h_active_img = draw_rect(hsize, active)
+        # create images; the thumbs are solid colors
+        h_normal_img = self.create_solid_image(hsize, thumbcolor)
+        h_pressed_img = self.create_solid_image(hsize, pressed)
+        h_active_img = self.create_solid_image(hsize, active)
 
-        v_normal_img = draw_rect(vsize, thumbcolor)
-        v_pressed_img = draw_rect(vsize, pressed)
-        v_active_img = draw_rect(vsize, active)
+        v_normal_img = self.create_solid_image(vsize, thumbcolor)
+        v_pressed_img = self.create_solid_image(vsize, pressed)
+        v_active_img = self.create_solid_image(vsize, active)
 
         return (
             h_normal_img,
@@ -2169,14 +2403,11 @@ class StyleBuilderTTK:
         """
         STYLE = "TScrollbar"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             h_ttkstyle = f"Horizontal.{STYLE}"
             v_ttkstyle = f"Vertical.{STYLE}"
 
-            if self.is_light_theme:
-                background = self.colors.border
-            else:
-                background = self.colors.selectbg
+            background = self.bordercolor
 
         else:
             h_ttkstyle = f"{colorname}.Horizontal.{STYLE}"
@@ -2189,7 +2420,7 @@ class StyleBuilderTTK:
             else:
                 troughcolor = self.colors.light
         else:
-            troughcolor = Colors.update_hsv(self.colors.selectbg, vd=-0.2)
+            troughcolor = self.troughcolor
 
         pressed = Colors.update_hsv(background, vd=-0.05)
         active = Colors.update_hsv(background, vd=0.05)
@@ -2245,7 +2476,6 @@ class StyleBuilderTTK:
                 )
             ],
         )
-        self.style._build_configure(h_ttkstyle, arrowcolor=background)
         self.style.map(
             h_ttkstyle, arrowcolor=[("pressed", pressed), ("active", active)]
         )
@@ -2297,7 +2527,6 @@ class StyleBuilderTTK:
                 )
             ],
         )
-        self.style._build_configure(v_ttkstyle, arrowcolor=background)
         self.style.map(
             v_ttkstyle, arrowcolor=[("pressed", pressed), ("active", active)]
         )
@@ -2316,23 +2545,21 @@ class StyleBuilderTTK:
         """
         STYLE = "TSpinbox"
 
+        disabled_fg = self.bordercolor
+        bordercolor = self.bordercolor
         if self.is_light_theme:
-            disabled_fg = self.colors.border
-            bordercolor = self.colors.border
             readonly = self.colors.light
         else:
-            disabled_fg = self.colors.selectbg
-            bordercolor = self.colors.selectbg
             readonly = bordercolor
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             focuscolor = self.colors.primary
         else:
             ttkstyle = f"{colorname}.{STYLE}"
             focuscolor = self.colors.get(colorname)
 
-        if all([colorname, colorname != DEFAULT]):
+        if colorname and colorname != DEFAULT:
             bordercolor = focuscolor
 
         if colorname == "light":
@@ -2446,16 +2673,14 @@ class StyleBuilderTTK:
         f = font.nametofont("TkDefaultFont")
         rowheight = f.metrics()["linespace"]
 
+        disabled_fg = self.input_disabled_fg
+        bordercolor = self.bordercolor
         if self.is_light_theme:
-            disabled_fg = Colors.update_hsv(self.colors.inputbg, vd=-0.2)
-            bordercolor = self.colors.border
             hover = Colors.update_hsv(self.colors.light, vd=-0.1)
         else:
-            disabled_fg = Colors.update_hsv(self.colors.inputbg, vd=-0.3)
-            bordercolor = self.colors.selectbg
             hover = Colors.update_hsv(self.colors.dark, vd=0.1)
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             background = self.colors.inputbg
             foreground = self.colors.inputfg
             body_style = STYLE
@@ -2562,14 +2787,10 @@ class StyleBuilderTTK:
         f = font.nametofont("TkDefaultFont")
         rowheight = f.metrics()["linespace"]
 
-        if self.is_light_theme:
-            disabled_fg = Colors.update_hsv(self.colors.inputbg, vd=-0.2)
-            bordercolor = self.colors.border
-        else:
-            disabled_fg = Colors.update_hsv(self.colors.inputbg, vd=-0.3)
-            bordercolor = self.colors.selectbg
+        disabled_fg = self.input_disabled_fg
+        bordercolor = self.bordercolor
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             background = self.colors.inputbg
             foreground = self.colors.inputfg
             body_style = STYLE
@@ -2678,7 +2899,7 @@ class StyleBuilderTTK:
         """
         STYLE = "TFrame"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             background = self.colors.bg
         else:
@@ -2700,7 +2921,7 @@ class StyleBuilderTTK:
         """
         STYLE = "TButton"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             foreground = self.colors.get_foreground(PRIMARY)
             background = self.colors.primary
@@ -2710,11 +2931,17 @@ class StyleBuilderTTK:
             background = self.colors.get(colorname)
 
         bordercolor = background
-        disabled_bg = Colors.make_transparent(0.10, self.colors.fg, self.colors.bg)
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)
+        disabled_bg = self.disabled_bg
+        disabled_fg = self.disabled_fg
         pressed = Colors.make_transparent(0.80, background, self.colors.bg)
         hover = Colors.make_transparent(0.90, background, self.colors.bg)        
 
+        background_map = (
+            ("disabled", disabled_bg),
+            ("pressed !disabled", pressed),
+            ("hover !disabled", hover),
+        )
+
         self.style._build_configure(
             ttkstyle,
             foreground=foreground,
@@ -2731,22 +2958,10 @@ class StyleBuilderTTK:
         self.style.map(
             ttkstyle,
             foreground=[("disabled", disabled_fg)],
-            background=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
+            background=background_map,
             bordercolor=[("disabled", disabled_bg)],
-            darkcolor=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
-            lightcolor=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
+            darkcolor=background_map,
+            lightcolor=background_map,
         )
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
@@ -2761,9 +2976,9 @@ class StyleBuilderTTK:
         """
         STYLE = "Outline.TButton"
 
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)
+        disabled_fg = self.disabled_fg
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             colorname = PRIMARY
         else:
@@ -2776,6 +2991,15 @@ class StyleBuilderTTK:
         pressed = foreground
         hover = foreground
 
+        active_map = (
+            ("pressed !disabled", pressed),
+            ("hover !disabled", hover),
+        )
+        focus_map = (
+            ("pressed !disabled", foreground_pressed),
+            ("hover !disabled", foreground_pressed),
+        )
+
         self.style._build_configure(
             ttkstyle,
             foreground=foreground,
@@ -2796,27 +3020,15 @@ class StyleBuilderTTK:
                 ("pressed !disabled", foreground_pressed),
                 ("hover !disabled", foreground_pressed),
             ],
-            background=[
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
+            background=active_map,
             bordercolor=[
                 ("disabled", disabled_fg),
                 ("pressed !disabled", pressed),
                 ("hover !disabled", hover),
             ],
-            focuscolor=[
-                ("pressed !disabled", foreground_pressed),
-                ("hover !disabled", foreground_pressed),
-            ],
-            darkcolor=[
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
-            lightcolor=[
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
+            focuscolor=focus_map,
+            darkcolor=active_map,
+            lightcolor=active_map,
         )
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
@@ -2829,30 +3041,37 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "Link.TButton"
 
-        pressed = self.colors.info
-        hover = self.colors.info
+        pressed = colors.info
+        hover = colors.info
 
-        if any([colorname == DEFAULT, colorname == ""]):
-            foreground = self.colors.fg
+        if colorname == DEFAULT or colorname == "":
+            foreground = colors.fg
             ttkstyle = STYLE
         elif colorname == LIGHT:
-            foreground = self.colors.fg
+            foreground = colors.fg
             ttkstyle = f"{colorname}.{STYLE}"
         else:
-            foreground = self.colors.get(colorname)
+            foreground = colors.get(colorname)
             ttkstyle = f"{colorname}.{STYLE}"
 
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)  
+        disabled_fg = self.disabled_fg
+        # the background colors do not change with the widget state
+        bg_map = (
+            ("disabled", colors.bg),
+            ("pressed !disabled", colors.bg),
+            ("hover !disabled", colors.bg),
+        )
 
         self.style._build_configure(
             ttkstyle,
             foreground=foreground,
-            background=self.colors.bg,
-            bordercolor=self.colors.bg,
-            darkcolor=self.colors.bg,
-            lightcolor=self.colors.bg,
+            background=colors.bg,
+            bordercolor=colors.bg,
+            darkcolor=colors.bg,
+            lightcolor=colors.bg,
             relief=tk.RAISED,
             focusthickness=0,
             focuscolor=foreground,
@@ -2871,36 +3090,158 @@ class StyleBuilderTTK:
                 ("pressed !disabled", pressed),
                 ("hover !disabled", pressed),
             ],
-            background=[
-                ("disabled", self.colors.bg),
-                ("pressed !disabled", self.colors.bg),
-                ("hover !disabled", self.colors.bg),
-            ],
-            bordercolor=[
-                ("disabled", self.colors.bg),
-                ("pressed !disabled", self.colors.bg),
-                ("hover !disabled", self.colors.bg),
-            ],
-            darkcolor=[
-                ("disabled", self.colors.bg),
-                ("pressed !disabled", self.colors.bg),
-                ("hover !disabled", self.colors.bg),
-            ],
-            lightcolor=[
-                ("disabled", self.colors.bg),
-                ("pressed !disabled", self.colors.bg),
-                ("hover !disabled", self.colors.bg),
-            ],
+            background=bg_map,
+            bordercolor=bg_map,
+            darkcolor=bg_map,
+            lightcolor=bg_map,
         )
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
 
-    def create_square_toggle_assets(self, colorname=DEFAULT):
-        """Create the image assets used to build a square toggle
-        style.
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def create_toggle_masks(shape, flip=False):
+        """Create the masks used to compose a toggle image. The
+        geometry is the same for every color, so the masks are drawn
+        once per shape with the same calls that would draw the toggle
+        itself.
 
         Parameters:
 
+            shape (str):
+                The shape of the toggle; `round` or `square`.
+
+            flip (bool):
+                Rotate the masks 180 degrees so that the indicator is on
+                the right side of the toggle.
+
+        Returns:
+
+            Tuple[Image.Image]:
+                The outer, fill, border, and indicator masks.
+        """
+        inner = Image.new("L", (226, 130))
+        border = Image.new("L", (226, 130))
+        indicator = Image.new("L", (226, 130))
+        if shape == "round":
+            ImageDraw.Draw(inner).rounded_rectangle(
+                xy=[1, 1, 225, 129], radius=64, outline=0, width=6, fill=255
+            )
+            ImageDraw.Draw(border).rounded_rectangle(
+                xy=[1, 1, 225, 129], radius=64, outline=255, width=6
+            )
+            ImageDraw.Draw(indicator).ellipse([20, 18, 112, 110], fill=255)
+        else:
+            ImageDraw.Draw(inner).rectangle(
+                xy=[1, 1, 225, 129], outline=0, width=6, fill=255
+            )
+            ImageDraw.Draw(border).rectangle(
+                xy=[1, 1, 225, 129], outline=255, width=6
+            )
+            ImageDraw.Draw(indicator).rectangle([18, 18, 110, 110], fill=255)
+        outer = ImageChops.add(border, inner)
+        masks = (outer, inner, border, indicator)
+        if flip:
+            masks = tuple(m.transpose(Image.ROTATE_180) for m in masks)
+        return masks
+
+    @staticmethod
+    def create_toggle_image(masks, size, border, indicator, fill=None):
+        """Compose a toggle image from the toggle masks and resize it.
+        When `fill` is `None`, the inside of the toggle is left
+        transparent.
+
+        Parameters:
+
+            masks (Tuple[Image.Image]):
+                The masks returned by `create_toggle_masks`.
+
+            size (Tuple[int, int]):
+                The size of the toggle image.
+
+            border (str):
+                The border color.
+
+            indicator (str):
+                The indicator color.
+
+            fill (str):
+                The fill color.
+
+        Returns:
+
+            Image.Image:
+                The toggle image.
+        """
+        outer, inner, border_mask, indicator_mask = masks
+        img = Image.new("RGBA", outer.size, border)
+        if fill is None:
+            img.putalpha(ImageChops.add(border_mask, indicator_mask))
+        else:
+            img.putalpha(outer)
+            img.paste(fill, mask=inner)
+        img.paste(indicator, mask=indicator_mask)
+        return img.resize(size, Image.LANCZOS)
+
+    def create_toggle_state_image(
+        self, shape, size, border, indicator, fill=None, flip=False
+    ):
+        """Create the image for one state of a toggle. The image only
+        depends on its shape, size, and colors, so it is shared by every
+        toggle color and theme that uses the same values.
+
+        Parameters:
+
+            shape (str):
+                The shape of the toggle; `round` or `square`.
+
+            size (Tuple[int, int]):
+                The size of the toggle image.
+
+            border (str):
+                The border color.
+
+            indicator (str):
+                The indicator color.
+
+            fill (str):
+                The fill color; `None` for a transparent inside.
+
+            flip (bool):
+                Put the indicator on the right side of the toggle.
+
+        Returns:
+
+            str:
+                The PhotoImage name.
+        """
+        key = (f"{shape}_toggle", *size, border, indicator, fill, flip)
+        names = self.get_cached_assets(key)
+        if names:
+            return names[0]
+
+        _img = self.create_toggle_image(
+            self.create_toggle_masks(shape, flip),
+            size,
+            border,
+            indicator,
+            fill,
+        )
+        img = ImageTk.PhotoImage(_img)
+        name = util.get_image_name(img)
+        self.theme_images[name] = img
+        self.cache_assets(key, name)
+        return name
+
+    def create_toggle_assets(self, shape, colorname=DEFAULT):
+        """Create the image assets used to build a round or square
+        toggle style.
+
+        Parameters:
+
+            shape (str):
+                The shape of the toggle; `round` or `square`.
+
             colorname (str):
                 The color label used to style the widget.
 
@@ -2909,78 +3250,67 @@ class StyleBuilderTTK:
             Tuple[str]:
                 A tuple of PhotoImage names.
         """
-        size = self.scale_size([24, 15])
-        if any([colorname == DEFAULT, colorname == ""]):
+        colors = self.colors
+        size = tuple(self.scale_size([24, 15]))
+        if colorname == DEFAULT or colorname == "":
             colorname = PRIMARY
 
         # set default style color values
-        prime_color = self.colors.get(colorname)
+        prime_color = colors.get(colorname)
         on_border = prime_color
-        on_indicator = self.colors.selectfg
+        on_indicator = colors.selectfg
         on_fill = prime_color
-        off_fill = self.colors.bg
-        disabled_fg = Colors.make_transparent(0.3, self.colors.fg, self.colors.bg)  
-        off_border = Colors.make_transparent(0.4, self.colors.fg, self.colors.bg)
-        off_indicator = Colors.make_transparent(0.4, self.colors.fg, self.colors.bg)     
+        off_fill = colors.bg
+        off_border = self.off_border
+        off_indicator = off_border
+        disabled_fg = self.disabled_fg
 
         # override defaults for light and dark colors
         if colorname == LIGHT:
-            on_border = self.colors.dark
+            on_border = colors.dark
             on_indicator = on_border
         elif colorname == DARK:
-            on_border = self.colors.light
+            on_border = colors.light
             on_indicator = on_border
 
         # toggle off
-        _off = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_off)
-        draw.rectangle(
-            xy=[1, 1, 225, 129], outline=off_border, width=6, fill=off_fill
+        off_name = self.create_toggle_state_image(
+            shape, size, off_border, off_indicator, off_fill
         )
-        draw.rectangle([18, 18, 110, 110], fill=off_indicator)
-
-        off_img = ImageTk.PhotoImage(_off.resize(size, Image.LANCZOS))
-        off_name = util.get_image_name(off_img)
-        self.theme_images[off_name] = off_img
 
         # toggle on
-        toggle_on = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(toggle_on)
-        draw.rectangle(
-            xy=[1, 1, 225, 129], outline=on_border, width=6, fill=on_fill
+        on_name = self.create_toggle_state_image(
+            shape, size, on_border, on_indicator, on_fill, flip=True
         )
-        draw.rectangle([18, 18, 110, 110], fill=on_indicator)
-        _on = toggle_on.transpose(Image.ROTATE_180)
-        on_img = ImageTk.PhotoImage(_on.resize(size, Image.LANCZOS))
-        on_name = util.get_image_name(on_img)
-        self.theme_images[on_name] = on_img
 
         # toggle disabled
-        _disabled = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_disabled)
-        draw.rectangle([1, 1, 225, 129], outline=disabled_fg, width=6)
-        draw.rectangle([18, 18, 110, 110], fill=disabled_fg)
-        disabled_img = ImageTk.PhotoImage(
-            _disabled.resize(size, Image.LANCZOS)
+        disabled_name = self.create_toggle_state_image(
+            shape, size, disabled_fg, disabled_fg
         )
-        disabled_name = util.get_image_name(disabled_img)
-        self.theme_images[disabled_name] = disabled_img
 
         # toggle on / disabled
-        toggle_on_disabled = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(toggle_on_disabled)
-        draw.rectangle(
-            xy=[1, 1, 225, 129], outline=disabled_fg, width=6, fill=off_fill
+        on_disabled_name = self.create_toggle_state_image(
+            shape, size, disabled_fg, disabled_fg, off_fill, flip=True
         )
-        draw.rectangle([18, 18, 110, 110], fill=disabled_fg)
-        _on_disabled = toggle_on_disabled.transpose(Image.ROTATE_180)
-        on_dis_img = ImageTk.PhotoImage(_on_disabled.resize(size, Image.LANCZOS))
-        on_disabled_name = util.get_image_name(on_dis_img)
-        self.theme_images[on_disabled_name] = on_dis_img
-
 
         return off_name, on_name, disabled_name, on_disabled_name
 
+    def create_square_toggle_assets(self, colorname=DEFAULT):
+        """Create the image assets used to build a square toggle
+        style.
+
+        Parameters:
+
+            colorname (str):
+                The color label used to style the widget.
+
+        Returns:
+
+            Tuple[str]:
+                A tuple of PhotoImage names.
+        """
+        return self.create_toggle_assets("square", colorname)
+
     def create_toggle_style(self, colorname=DEFAULT):
         """Create a round toggle style for the ttk.Checkbutton widget.
 
@@ -3003,91 +3333,7 @@ class StyleBuilderTTK:
             Tuple[str]:
                 A tuple of PhotoImage names.
         """
-        size = self.scale_size([24, 15])
-
-        if any([colorname == DEFAULT, colorname == ""]):
-            colorname = PRIMARY
-
-        # set default style color values
-        prime_color = self.colors.get(colorname)
-        on_border = prime_color
-        on_indicator = self.colors.selectfg
-        on_fill = prime_color
-        off_fill = self.colors.bg
-
-        disabled_fg = Colors.make_transparent(0.3, self.colors.fg, self.colors.bg)  
-        off_border = Colors.make_transparent(0.4, self.colors.fg, self.colors.bg)
-        off_indicator = Colors.make_transparent(0.4, self.colors.fg, self.colors.bg)  
-
-        # override defaults for light and dark colors
-        if colorname == LIGHT:
-            on_border = self.colors.dark
-            on_indicator = on_border
-        elif colorname == DARK:
-            on_border = self.colors.light
-            on_indicator = on_border
-
-        # toggle off
-        _off = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_off)
-        draw.rounded_rectangle(
-            xy=[1, 1, 225, 129],
-            radius=(128 / 2),
-            outline=off_border,
-            width=6,
-            fill=off_fill,
-        )
-        draw.ellipse([20, 18, 112, 110], fill=off_indicator)
-        off_img = ImageTk.PhotoImage(_off.resize(size, Image.LANCZOS))
-        off_name = util.get_image_name(off_img)
-        self.theme_images[off_name] = off_img
-
-        # toggle on
-        _on = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_on)
-        draw.rounded_rectangle(
-            xy=[1, 1, 225, 129],
-            radius=(128 / 2),
-            outline=on_border,
-            width=6,
-            fill=on_fill,
-        )
-        draw.ellipse([20, 18, 112, 110], fill=on_indicator)
-        _on = _on.transpose(Image.ROTATE_180)
-        on_img = ImageTk.PhotoImage(_on.resize(size, Image.LANCZOS))
-        on_name = util.get_image_name(on_img)
-        self.theme_images[on_name] = on_img
-
-        # toggle on / disabled
-        _on_disabled = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_on_disabled)
-        draw.rounded_rectangle(
-            xy=[1, 1, 225, 129],
-            radius=(128 / 2),
-            outline=disabled_fg,
-            width=6,
-            fill=off_fill,
-        )
-        draw.ellipse([20, 18, 112, 110], fill=disabled_fg)
-        _on_disabled = _on_disabled.transpose(Image.ROTATE_180)
-        on_dis_img = ImageTk.PhotoImage(_on_disabled.resize(size, Image.LANCZOS))
-        on_disabled_name = util.get_image_name(on_dis_img)
-        self.theme_images[on_disabled_name] = on_dis_img        
-
-        # toggle disabled
-        _disabled = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_disabled)
-        draw.rounded_rectangle(
-            xy=[1, 1, 225, 129], radius=(128 / 2), outline=disabled_fg, width=6
-        )
-        draw.ellipse([20, 18, 112, 110], fill=disabled_fg)
-        disabled_img = ImageTk.PhotoImage(
-            _disabled.resize(size, Image.LANCZOS)
-        )
-        disabled_name = util.get_image_name(disabled_img)
-        self.theme_images[disabled_name] = disabled_img
-
-        return off_name, on_name, disabled_name, on_disabled_name
+        return self.create_toggle_assets("round", colorname)
 
     def create_round_toggle_style(self, colorname=DEFAULT):
         """Create a round toggle style for the ttk.Checkbutton widget.
@@ -3097,11 +3343,12 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "Round.Toggle"
 
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)  
+        disabled_fg = self.disabled_fg
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             colorname = PRIMARY
         else:
@@ -3136,13 +3383,13 @@ class StyleBuilderTTK:
             relief=tk.FLAT,
             borderwidth=0,
             padding=0,
-            foreground=self.colors.fg,
-            background=self.colors.bg,
+            foreground=colors.fg,
+            background=colors.bg,
         )
         self.style.map(
             ttkstyle,
             foreground=[("disabled", disabled_fg)],
-            background=[("selected", self.colors.bg)],
+            background=[("selected", colors.bg)],
         )
         self.style.layout(
             ttkstyle,
@@ -3184,12 +3431,13 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
 
         STYLE = "Square.Toggle"
 
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)  
+        disabled_fg = self.disabled_fg
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
         else:
             ttkstyle = f"{colorname}.{STYLE}"
@@ -3241,14 +3489,14 @@ class StyleBuilderTTK:
             ],
         )
         self.style._build_configure(
-            ttkstyle, relief=tk.FLAT, borderwidth=0, foreground=self.colors.fg
+            ttkstyle, relief=tk.FLAT, borderwidth=0, foreground=colors.fg
         )
         self.style.map(
             ttkstyle,
             foreground=[("disabled", disabled_fg)],
             background=[
-                ("selected", self.colors.bg),
-                ("!selected", self.colors.bg),
+                ("selected", colors.bg),
+                ("!selected", colors.bg),
             ],
         )
         # register ttkstyle
@@ -3263,28 +3511,32 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "Toolbutton"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
-            toggle_on = self.colors.primary
+            toggle_on = colors.primary
         else:
             ttkstyle = f"{colorname}.{STYLE}"
-            toggle_on = self.colors.get(colorname)
+            toggle_on = colors.get(colorname)
 
-        foreground = self.colors.get_foreground(colorname)
+        foreground = colors.get_foreground(colorname)
 
-        if self.is_light_theme:
-            toggle_off = self.colors.border
-        else:
-            toggle_off = self.colors.selectbg
+        toggle_off = self.bordercolor
 
-        disabled_bg = Colors.make_transparent(0.10, self.colors.fg, self.colors.bg)
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)
+        disabled_bg = self.disabled_bg
+        disabled_fg = self.disabled_fg
+        toggle_map = (
+            ("disabled", disabled_bg),
+            ("pressed !disabled", toggle_on),
+            ("selected !disabled", toggle_on),
+            ("hover !disabled", toggle_on),
+        )
 
         self.style._build_configure(
             ttkstyle,
-            foreground=self.colors.selectfg,
+            foreground=colors.selectfg,
             background=toggle_off,
             bordercolor=toggle_off,
             darkcolor=toggle_off,
@@ -3302,30 +3554,10 @@ class StyleBuilderTTK:
                 ("hover", foreground),
                 ("selected", foreground),
             ],
-            background=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", toggle_on),
-                ("selected !disabled", toggle_on),
-                ("hover !disabled", toggle_on),
-            ],
-            bordercolor=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", toggle_on),
-                ("selected !disabled", toggle_on),
-                ("hover !disabled", toggle_on),
-            ],
-            darkcolor=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", toggle_on),
-                ("selected !disabled", toggle_on),
-                ("hover !disabled", toggle_on),
-            ],
-            lightcolor=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", toggle_on),
-                ("selected !disabled", toggle_on),
-                ("hover !disabled", toggle_on),
-            ],
+            background=toggle_map,
+            bordercolor=toggle_map,
+            darkcolor=toggle_map,
+            lightcolor=toggle_map,
         )
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
@@ -3339,30 +3571,37 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "Outline.Toolbutton"
 
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)   
+        disabled_fg = self.disabled_fg
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             colorname = PRIMARY
         else:
             ttkstyle = f"{colorname}.{STYLE}"
 
-        foreground = self.colors.get(colorname)
-        background = self.colors.get_foreground(colorname)
+        foreground = colors.get(colorname)
+        background = colors.get_foreground(colorname)
         foreground_pressed = background
         bordercolor = foreground
         pressed = foreground
         hover = foreground
+        shade_map = (
+            ("disabled", colors.bg),
+            ("pressed !disabled", pressed),
+            ("selected !disabled", pressed),
+            ("hover !disabled", hover),
+        )
 
         self.style._build_configure(
             ttkstyle,
             foreground=foreground,
-            background=self.colors.bg,
+            background=colors.bg,
             bordercolor=bordercolor,
-            darkcolor=self.colors.bg,
-            lightcolor=self.colors.bg,
+            darkcolor=colors.bg,
+            lightcolor=colors.bg,
             relief=tk.RAISED,
             focusthickness=0,
             focuscolor=foreground,
@@ -3391,18 +3630,8 @@ class StyleBuilderTTK:
                 ("selected !disabled", pressed),
                 ("hover !disabled", hover),
             ],
-            darkcolor=[
-                ("disabled", self.colors.bg),
-                ("pressed !disabled", pressed),
-                ("selected !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
-            lightcolor=[
-                ("disabled", self.colors.bg),
-                ("pressed !disabled", pressed),
-                ("selected !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
+            darkcolor=shade_map,
+            lightcolor=shade_map,
         )
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
@@ -3415,36 +3644,35 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "TEntry"
 
         # general default colors
+        disabled_fg = self.bordercolor
+        bordercolor = self.bordercolor
         if self.is_light_theme:
-            disabled_fg = self.colors.border
-            bordercolor = self.colors.border
-            readonly = self.colors.light
+            readonly = colors.light
         else:
-            disabled_fg = self.colors.selectbg
-            bordercolor = self.colors.selectbg
             readonly = bordercolor
 
-        if any([colorname == DEFAULT, not colorname]):
+        if colorname == DEFAULT or not colorname:
             # default style
             ttkstyle = STYLE
-            focuscolor = self.colors.primary
+            focuscolor = colors.primary
         else:
             # colored style
             ttkstyle = f"{colorname}.{STYLE}"
-            focuscolor = self.colors.get(colorname)
+            focuscolor = colors.get(colorname)
             bordercolor = focuscolor
 
         self.style._build_configure(
             ttkstyle,
             bordercolor=bordercolor,
-            darkcolor=self.colors.inputbg,
-            lightcolor=self.colors.inputbg,
-            fieldbackground=self.colors.inputbg,
-            foreground=self.colors.inputfg,
-            insertcolor=self.colors.inputfg,
+            darkcolor=colors.inputbg,
+            lightcolor=colors.inputbg,
+            fieldbackground=colors.inputbg,
+            foreground=colors.inputfg,
+            insertcolor=colors.inputfg,
             padding=5,
         )
         self.style.map(
@@ -3452,17 +3680,17 @@ class StyleBuilderTTK:
             foreground=[("disabled", disabled_fg)],
             fieldbackground=[("readonly", readonly)],
             bordercolor=[
-                ("invalid", self.colors.danger),
+                ("invalid", colors.danger),
                 ("focus !disabled", focuscolor),
                 ("hover !disabled", focuscolor),
             ],
             lightcolor=[
-                ("focus invalid", self.colors.danger),
+                ("focus invalid", colors.danger),
                 ("focus !disabled", focuscolor),
                 ("readonly", readonly),
             ],
             darkcolor=[
-                ("focus invalid", self.colors.danger),
+                ("focus invalid", colors.danger),
                 ("focus !disabled", focuscolor),
                 ("readonly", readonly),
             ],
@@ -3482,17 +3710,33 @@ class StyleBuilderTTK:
             Tuple[str]:
                 A tuple of PhotoImage names
         """
-        prime_color = self.colors.get(colorname)
+        colors = self.colors
+        prime_color = colors.get(colorname)
         on_fill = prime_color
-        off_fill = self.colors.bg
-        on_indicator = self.colors.selectfg
+        off_fill = colors.bg
+        on_indicator = colors.selectfg
         size = self.scale_size([14, 14])
-        off_border = Colors.make_transparent(0.4, self.colors.fg, self.colors.bg)
-        disabled = Colors.make_transparent(0.3, self.colors.fg, self.colors.bg)
+        off_border = self.off_border
+        disabled = self.disabled_fg
 
         if self.is_light_theme:
             if colorname == LIGHT:
-                on_indicator = self.colors.dark
+                on_indicator = colors.dark
+        outlined = colorname == LIGHT and self.is_light_theme
+
+        key = (
+            "radiobutton",
+            *size,
+            outlined,
+            on_fill,
+            off_fill,
+            on_indicator,
+            off_border,
+            disabled,
+        )
+        names = self.get_cached_assets(key)
+        if names:
+            return names
 
         # radio off
         _off = Image.new("RGBA", (134, 134))
@@ -3507,7 +3751,7 @@ class StyleBuilderTTK:
         # radio on
         _on = Image.new("RGBA", (134, 134))
         draw = ImageDraw.Draw(_on)
-        if colorname == LIGHT and self.is_light_theme:
+        if outlined:
             draw.ellipse(xy=[1, 1, 133, 133], outline=off_border, width=6)
         else:
             draw.ellipse(xy=[1, 1, 133, 133], fill=on_fill)
@@ -3519,14 +3763,14 @@ class StyleBuilderTTK:
         # radio on/disabled
         _on_dis = Image.new("RGBA", (134, 134))
         draw = ImageDraw.Draw(_on_dis)
-        if colorname == LIGHT and self.is_light_theme:
+        if outlined:
             draw.ellipse(xy=[1, 1, 133, 133], outline=off_border, width=6)
         else:
             draw.ellipse(xy=[1, 1, 133, 133], fill=disabled)
         draw.ellipse([40, 40, 94, 94], fill=off_fill)
         on_dis_img = ImageTk.PhotoImage(_on_dis.resize(size, Image.LANCZOS))
         on_disabled_name = util.get_image_name(on_dis_img)
-        self.theme_images[on_disabled_name] = on_dis_img        
+        self.theme_images[on_disabled_name] = on_dis_img
 
         # radio disabled
         _disabled = Image.new("RGBA", (134, 134))
@@ -3540,7 +3784,9 @@ class StyleBuilderTTK:
         disabled_name = util.get_image_name(disabled_img)
         self.theme_images[disabled_name] = disabled_img
 
-        return off_name, on_name, disabled_name, on_disabled_name
+        names = off_name, on_name, disabled_name, on_disabled_name
+        self.cache_assets(key, *names)
+        return names
 
     def create_radiobutton_style(self, colorname=DEFAULT):
         """Create a style for the ttk.Radiobutton widget.
@@ -3553,9 +3799,9 @@ class StyleBuilderTTK:
 
         STYLE = "TRadiobutton"
 
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)
+        disabled_fg = self.disabled_fg
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             colorname = PRIMARY
         else:
@@ -3577,7 +3823,6 @@ class StyleBuilderTTK:
             sticky=tk.W,
         )
         self.style.map(ttkstyle, foreground=[("disabled", disabled_fg)])
-        self.style._build_configure(ttkstyle)
         self.style.layout(
             ttkstyle,
             [
@@ -3672,16 +3917,9 @@ class StyleBuilderTTK:
         """
         STYLE = "Date.TButton"
 
-        if self.is_light_theme:
-            disabled_fg = self.colors.border
-        else:
-            disabled_fg = self.colors.selectbg
-
-        btn_foreground = Colors.get_foreground(self.colors, colorname)
-
-        img_normal = self.create_date_button_assets(btn_foreground)
+        disabled_fg = self.bordercolor
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             foreground = self.colors.get_foreground(PRIMARY)
             background = self.colors.primary
@@ -3690,8 +3928,16 @@ class StyleBuilderTTK:
             foreground = self.colors.get_foreground(colorname)
             background = self.colors.get(colorname)
 
+        img_normal = self.create_date_button_assets(foreground)
+
         pressed = Colors.update_hsv(background, vd=-0.1)
         hover = Colors.update_hsv(background, vd=0.10)
+        disabled_map = (("disabled", disabled_fg),)
+        background_map = (
+            ("disabled", disabled_fg),
+            ("pressed !disabled", pressed),
+            ("hover !disabled", hover),
+        )
 
         self.style._build_configure(
             ttkstyle,
@@ -3709,23 +3955,11 @@ class StyleBuilderTTK:
         )
         self.style.map(
             ttkstyle,
-            foreground=[("disabled", disabled_fg)],
-            background=[
-                ("disabled", disabled_fg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
-            bordercolor=[("disabled", disabled_fg)],
-            darkcolor=[
-                ("disabled", disabled_fg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
-            lightcolor=[
-                ("disabled", disabled_fg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
+            foreground=disabled_map,
+            background=background_map,
+            bordercolor=disabled_map,
+            darkcolor=background_map,
+            lightcolor=background_map,
         )
 
         self.style._register_ttkstyle(ttkstyle)
@@ -3739,32 +3973,37 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
 
         STYLE = "TCalendar"
 
-        if any([colorname == DEFAULT, colorname == ""]):
-            prime_color = self.colors.primary
+        if colorname == DEFAULT or colorname == "":
+            prime_color = colors.primary
             ttkstyle = STYLE
             chevron_style = "Chevron.TButton"
         else:
-            prime_color = self.colors.get(colorname)
+            prime_color = colors.get(colorname)
             ttkstyle = f"{colorname}.{STYLE}"
             chevron_style = f"Chevron.{colorname}.TButton"
 
+        disabled_fg = self.input_disabled_fg
         if self.is_light_theme:
-            disabled_fg = Colors.update_hsv(self.colors.inputbg, vd=-0.2)
             pressed = Colors.update_hsv(prime_color, vd=-0.1)
         else:
-            disabled_fg = Colors.update_hsv(self.colors.inputbg, vd=-0.3)
             pressed = Colors.update_hsv(prime_color, vd=0.1)
+        pressed_map = (
+            ("pressed !disabled", pressed),
+            ("selected !disabled", pressed),
+            ("hover !disabled", pressed),
+        )
 
         self.style._build_configure(
             ttkstyle,
-            foreground=self.colors.fg,
-            background=self.colors.bg,
-            bordercolor=self.colors.bg,
-            darkcolor=self.colors.bg,
-            lightcolor=self.colors.bg,
+            foreground=colors.fg,
+            background=colors.bg,
+            bordercolor=colors.bg,
+            darkcolor=colors.bg,
+            lightcolor=colors.bg,
             relief=tk.RAISED,
             focusthickness=0,
             focuscolor="",
@@ -3801,31 +4040,19 @@ class StyleBuilderTTK:
             ttkstyle,
             foreground=[
                 ("disabled", disabled_fg),
-                ("pressed !disabled", self.colors.selectfg),
-                ("selected !disabled", self.colors.selectfg),
-                ("hover !disabled", self.colors.selectfg),
-            ],
-            background=[
-                ("pressed !disabled", pressed),
-                ("selected !disabled", pressed),
-                ("hover !disabled", pressed),
+                ("pressed !disabled", colors.selectfg),
+                ("selected !disabled", colors.selectfg),
+                ("hover !disabled", colors.selectfg),
             ],
+            background=pressed_map,
             bordercolor=[
                 ("disabled", disabled_fg),
                 ("pressed !disabled", pressed),
                 ("selected !disabled", pressed),
                 ("hover !disabled", pressed),
             ],
-            darkcolor=[
-                ("pressed !disabled", pressed),
-                ("selected !disabled", pressed),
-                ("hover !disabled", pressed),
-            ],
-            lightcolor=[
-                ("pressed !disabled", pressed),
-                ("selected !disabled", pressed),
-                ("hover !disabled", pressed),
-            ],
+            darkcolor=pressed_map,
+            lightcolor=pressed_map,
         )
         self.style._build_configure(
             chevron_style, font="-size 14", focuscolor=""
@@ -3844,19 +4071,20 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "Metersubtxt.TLabel"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             if self.is_light_theme:
-                foreground = self.colors.secondary
+                foreground = colors.secondary
             else:
-                foreground = self.colors.light
+                foreground = colors.light
         else:
             ttkstyle = f"{colorname}.{STYLE}"
-            foreground = self.colors.get(colorname)
+            foreground = colors.get(colorname)
 
-        background = self.colors.bg
+        background = colors.bg
 
         self.style._build_configure(
             ttkstyle, foreground=foreground, background=background
@@ -3875,6 +4103,7 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
 
         STYLE = "Meter.TLabel"
 
@@ -3883,20 +4112,20 @@ class StyleBuilderTTK:
 
         if self.is_light_theme:
             if colorname == LIGHT:
-                troughcolor = self.colors.bg
+                troughcolor = colors.bg
             else:
-                troughcolor = self.colors.light
+                troughcolor = colors.light
         else:
-            troughcolor = Colors.update_hsv(self.colors.selectbg, vd=-0.2)
+            troughcolor = self.troughcolor
+
+        background = colors.bg
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
-            background = self.colors.bg
-            textcolor = self.colors.primary
+            textcolor = colors.primary
         else:
             ttkstyle = f"{colorname}.{STYLE}"
-            textcolor = self.colors.get(colorname)
-            background = self.colors.bg
+            textcolor = colors.get(colorname)
 
         self.style._build_configure(
             ttkstyle,
@@ -3915,16 +4144,17 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "TLabel"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        background = colors.bg
+
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
-            foreground = self.colors.fg
-            background = self.colors.bg
+            foreground = colors.fg
         else:
             ttkstyle = f"{colorname}.{STYLE}"
-            foreground = self.colors.get(colorname)
-            background = self.colors.bg
+            foreground = colors.get(colorname)
 
         # standard label
         self.style._build_configure(
@@ -3944,16 +4174,17 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE_INVERSE = "Inverse.TLabel"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE_INVERSE
-            background = self.colors.fg
-            foreground = self.colors.bg
+            background = colors.fg
+            foreground = colors.bg
         else:
             ttkstyle = f"{colorname}.{STYLE_INVERSE}"
-            background = self.colors.get(colorname)
-            foreground = self.colors.get_foreground(colorname)
+            background = colors.get(colorname)
+            foreground = colors.get_foreground(colorname)
 
         self.style._build_configure(
             ttkstyle, foreground=foreground, background=background
@@ -3969,21 +4200,19 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "TLabelframe"
 
-        background = self.colors.bg
+        background = colors.bg
 
-        if any([colorname == DEFAULT, colorname == ""]):
-            foreground = self.colors.fg
+        if colorname == DEFAULT or colorname == "":
+            foreground = colors.fg
             ttkstyle = STYLE
 
-            if self.is_light_theme:
-                bordercolor = self.colors.border
-            else:
-                bordercolor = self.colors.selectbg
+            bordercolor = self.bordercolor
 
         else:
-            foreground = self.colors.get(colorname)
+            foreground = colors.get(colorname)
             bordercolor = foreground
             ttkstyle = f"{colorname}.{STYLE}"
 
@@ -4015,9 +4244,9 @@ class StyleBuilderTTK:
         """
         STYLE = "TCheckbutton"
 
-        disabled_fg = Colors.make_transparent(0.3, self.colors.fg, self.colors.bg)
+        disabled_fg = self.disabled_fg
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             colorname = PRIMARY
             ttkstyle = STYLE
         else:
@@ -4077,22 +4306,25 @@ class StyleBuilderTTK:
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
 
-    def create_checkbutton_assets(self, colorname=DEFAULT):
-        """Create the image assets used to build the standard
-        checkbutton style.
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_checkbutton_font(winsys):
+        """Load the platform specific font used to draw the check mark
+        of the checkbutton. Parsing a truetype font is expensive, so the
+        font is loaded once and shared by all colors and themes.
 
         Parameters:
 
-            colorname (str):
-                The color label used to style the widget.
+            winsys (str):
+                The tkinter windowing system.
 
         Returns:
 
-            Tuple[str]:
-                A tuple of PhotoImage names.
+            Tuple[ImageFont, int, str]:
+                The font, the vertical offset of the indicator, and the
+                indicator character.
         """
         # set platform specific checkfont
-        winsys = self.style.tk.call("tk", "windowingsystem")
         indicator = "✓"
         if winsys == "win32":
             # Windows font
@@ -4124,26 +4356,58 @@ class StyleBuilderTTK:
             # Mac OS font
             fnt = ImageFont.truetype("LucidaGrande.ttc", 120)
             font_offset = -10
+        return fnt, font_offset, indicator
 
-        prime_color = self.colors.get(colorname)
+    def create_checkbutton_assets(self, colorname=DEFAULT):
+        """Create the image assets used to build the standard
+        checkbutton style.
+
+        Parameters:
+
+            colorname (str):
+                The color label used to style the widget.
+
+        Returns:
+
+            Tuple[str]:
+                A tuple of PhotoImage names.
+        """
+        colors = self.colors
+
+        prime_color = colors.get(colorname)
         on_border = prime_color
         on_fill = prime_color
-        off_fill = self.colors.bg
-        off_border = self.colors.selectbg
-        off_border = Colors.make_transparent(0.4, self.colors.fg, self.colors.bg)
-        disabled_fg = Colors.make_transparent(0.3, self.colors.fg, self.colors.bg)        
+        off_fill = colors.bg
+        off_border = self.off_border
+        disabled_fg = self.disabled_fg
 
         if colorname == LIGHT:
-            check_color = self.colors.dark
+            check_color = colors.dark
             on_border = check_color
         elif colorname == DARK:
-            check_color = self.colors.light
+            check_color = colors.light
             on_border = check_color
         else:
-            check_color = self.colors.selectfg
+            check_color = colors.selectfg
 
         size = self.scale_size([14, 14])
 
+        key = (
+            "checkbutton",
+            *size,
+            on_border,
+            on_fill,
+            off_fill,
+            off_border,
+            disabled_fg,
+            check_color,
+        )
+        names = self.get_cached_assets(key)
+        if names:
+            return names
+
+        fnt, font_offset, indicator = self.get_checkbutton_font(self.winsys)
+
         # checkbutton off
         checkbutton_off = Image.new("RGBA", (134, 134))
         draw = ImageDraw.Draw(checkbutton_off)
@@ -4179,13 +4443,7 @@ class StyleBuilderTTK:
        # checkbutton on/disabled
         checkbutton_on_disabled = Image.new("RGBA", (134, 134))
         draw = ImageDraw.Draw(checkbutton_on_disabled)
-        draw.rounded_rectangle(
-            [2, 2, 132, 132],
-            radius=16,
-            fill=disabled_fg,
-            outline=disabled_fg,
-            width=3,
-        )
+        draw.rounded_rectangle([2, 2, 132, 132], radius=16, fill=disabled_fg)
 
         draw.text((20, font_offset), indicator, font=fnt, fill=off_fill)
         on_dis_img = ImageTk.PhotoImage(checkbutton_on_disabled.resize(size, Image.LANCZOS))
@@ -4212,13 +4470,7 @@ class StyleBuilderTTK:
         # checkbutton alt/disabled
         checkbutton_alt_disabled = Image.new("RGBA", (134, 134))
         draw = ImageDraw.Draw(checkbutton_alt_disabled)
-        draw.rounded_rectangle(
-            [2, 2, 132, 132],
-            radius=16,
-            fill=disabled_fg,
-            outline=disabled_fg,
-            width=3,
-        )        
+        draw.rounded_rectangle([2, 2, 132, 132], radius=16, fill=disabled_fg)
         draw.line([36, 67, 100, 67], fill=off_fill, width=12)
         alt_dis_img = ImageTk.PhotoImage(
             checkbutton_alt_disabled.resize(size, Image.LANCZOS)
@@ -4238,7 +4490,16 @@ class StyleBuilderTTK:
         disabled_name = util.get_image_name(disabled_img)
         self.theme_images[disabled_name] = disabled_img
 
-        return off_name, on_name, disabled_name, alt_name, on_dis_name, alt_dis_name
+        names = (
+            off_name,
+            on_name,
+            disabled_name,
+            alt_name,
+            on_dis_name,
+            alt_dis_name,
+        )
+        self.cache_assets(key, *names)
+        return names
 
     def create_menubutton_style(self, colorname=DEFAULT):
         """Create a solid style for the ttk.Menubutton widget.
@@ -4248,21 +4509,28 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "TMenubutton"
 
-        foreground = self.colors.get_foreground(colorname)
+        foreground = colors.get_foreground(colorname)
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
-            background = self.colors.primary
+            background = colors.primary
         else:
             ttkstyle = f"{colorname}.{STYLE}"
-            background = self.colors.get(colorname)
+            background = colors.get(colorname)
 
-        disabled_bg = Colors.make_transparent(0.10, self.colors.fg, self.colors.bg)
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)
-        pressed = Colors.make_transparent(0.80, background, self.colors.bg)
-        hover = Colors.make_transparent(0.90, background, self.colors.bg)    
+        disabled_bg = self.disabled_bg
+        disabled_fg = self.disabled_fg
+        pressed = Colors.make_transparent(0.80, background, colors.bg)
+        hover = Colors.make_transparent(0.90, background, colors.bg)
+        disabled_map = (("disabled", disabled_fg),)
+        background_map = (
+            ("disabled", disabled_bg),
+            ("pressed !disabled", pressed),
+            ("hover !disabled", hover),
+        )
 
         self.style._build_configure(
             ttkstyle,
@@ -4276,33 +4544,17 @@ class StyleBuilderTTK:
             arrowpadding=(0, 0, 15, 0),
             relief=tk.RAISED,
             focusthickness=0,
-            focuscolor=self.colors.selectfg,
+            focuscolor=colors.selectfg,
             padding=(10, 5),
         )
         self.style.map(
             ttkstyle,
-            arrowcolor=[("disabled", disabled_fg)],
-            foreground=[("disabled", disabled_fg)],
-            background=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
-            bordercolor=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
-            darkcolor=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
-            lightcolor=[
-                ("disabled", disabled_bg),
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
+            arrowcolor=disabled_map,
+            foreground=disabled_map,
+            background=background_map,
+            bordercolor=background_map,
+            darkcolor=background_map,
+            lightcolor=background_map,
         )
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
@@ -4315,30 +4567,35 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "Outline.TMenubutton"
 
-        disabled_fg = Colors.make_transparent(0.30, self.colors.fg, self.colors.bg)
+        disabled_fg = self.disabled_fg
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
             colorname = PRIMARY
         else:
             ttkstyle = f"{colorname}.{STYLE}"
 
-        foreground = self.colors.get(colorname)
-        background = self.colors.get_foreground(colorname)
+        foreground = colors.get(colorname)
+        background = colors.get_foreground(colorname)
         foreground_pressed = background
         bordercolor = foreground
         pressed = foreground
         hover = foreground
+        active_map = (
+            ("pressed !disabled", pressed),
+            ("hover !disabled", hover),
+        )
 
         self.style._build_configure(
             ttkstyle,
             foreground=foreground,
-            background=self.colors.bg,
+            background=colors.bg,
             bordercolor=bordercolor,
-            darkcolor=self.colors.bg,
-            lightcolor=self.colors.bg,
+            darkcolor=colors.bg,
+            lightcolor=colors.bg,
             relief=tk.RAISED,
             focusthickness=0,
             focuscolor=foreground,
@@ -4354,23 +4611,14 @@ class StyleBuilderTTK:
                 ("pressed !disabled", foreground_pressed),
                 ("hover !disabled", foreground_pressed),
             ],
-            background=[
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
+            background=active_map,
             bordercolor=[
                 ("disabled", disabled_fg),
                 ("pressed", pressed),
                 ("hover", hover),
             ],
-            darkcolor=[
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
-            lightcolor=[
-                ("pressed !disabled", pressed),
-                ("hover !disabled", hover),
-            ],
+            darkcolor=active_map,
+            lightcolor=active_map,
             arrowcolor=[
                 ("disabled", disabled_fg),
                 ("pressed", foreground_pressed),
@@ -4388,22 +4636,22 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "TNotebook"
 
+        bordercolor = self.bordercolor
         if self.is_light_theme:
-            bordercolor = self.colors.border
-            foreground = self.colors.inputfg
+            foreground = colors.inputfg
         else:
-            bordercolor = self.colors.selectbg
-            foreground = self.colors.selectfg
+            foreground = colors.selectfg
 
-        if any([colorname == DEFAULT, colorname == ""]):
-            background = self.colors.inputbg
-            selectfg = self.colors.fg
+        if colorname == DEFAULT or colorname == "":
+            background = colors.inputbg
+            selectfg = colors.fg
             ttkstyle = STYLE
         else:
-            selectfg = self.colors.get_foreground(colorname)
-            background = self.colors.get(colorname)
+            selectfg = colors.get_foreground(colorname)
+            background = colors.get(colorname)
             ttkstyle = f"{colorname}.{STYLE}"
 
         ttkstyle_tab = f"{ttkstyle}.Tab"
@@ -4411,10 +4659,10 @@ class StyleBuilderTTK:
         # create widget style
         self.style._build_configure(
             ttkstyle,
-            background=self.colors.bg,
+            background=colors.bg,
             bordercolor=bordercolor,
-            lightcolor=self.colors.bg,
-            darkcolor=self.colors.bg,
+            lightcolor=colors.bg,
+            darkcolor=colors.bg,
             tabmargins=(0, 1, 1, 0),
         )
         self.style._build_configure(
@@ -4423,11 +4671,11 @@ class StyleBuilderTTK:
         self.style.map(
             ttkstyle_tab,
             background=[
-                ("selected", self.colors.bg),
+                ("selected", colors.bg),
                 ("!selected", background),
             ],
             lightcolor=[
-                ("selected", self.colors.bg),
+                ("selected", colors.bg),
                 ("!selected", background),
             ],
             bordercolor=[
@@ -4448,20 +4696,18 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         H_STYLE = "Horizontal.TPanedwindow"
         V_STYLE = "Vertical.TPanedwindow"
 
-        if self.is_light_theme:
-            default_color = self.colors.border
-        else:
-            default_color = self.colors.selectbg
+        default_color = self.bordercolor
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             sashcolor = default_color
             h_ttkstyle = H_STYLE
             v_ttkstyle = V_STYLE
         else:
-            sashcolor = self.colors.get(colorname)
+            sashcolor = colors.get(colorname)
             h_ttkstyle = f"{colorname}.{H_STYLE}"
             v_ttkstyle = f"{colorname}.{V_STYLE}"
 
@@ -4533,18 +4779,19 @@ class StyleBuilderTTK:
             colorname (str):
                 The color label used to style the widget.
         """
+        colors = self.colors
         STYLE = "TSizegrip"
 
-        if any([colorname == DEFAULT, colorname == ""]):
+        if colorname == DEFAULT or colorname == "":
             ttkstyle = STYLE
 
             if self.is_light_theme:
-                grip_color = self.colors.border
+                grip_color = colors.border
             else:
-                grip_color = self.colors.inputbg
+                grip_color = colors.inputbg
         else:
             ttkstyle = f"{colorname}.{STYLE}"
-            grip_color = self.colors.get(colorname)
+            grip_color = colors.get(colorname)
 
         image = self.create_sizegrip_assets(grip_color)
 
@@ -4579,19 +4826,18 @@ class StyleBuilderTTK:
             widget (ttk.Combobox):
                 The combobox element to be updated.
         """
-        if self.is_light_theme:
-            bordercolor = self.colors.border
-        else:
-            bordercolor = self.colors.selectbg
-
-        tk_settings = []
-        tk_settings.extend(["-borderwidth", 2])
-        tk_settings.extend(["-highlightthickness", 1])
-        tk_settings.extend(["-highlightcolor", bordercolor])
-        tk_settings.extend(["-background", self.colors.inputbg])
-        tk_settings.extend(["-foreground", self.colors.inputfg])
-        tk_settings.extend(["-selectbackground", self.colors.selectbg])
-        tk_settings.extend(["-selectforeground", self.colors.selectfg])
+        colors = self.colors
+        bordercolor = self.bordercolor
+
+        tk_settings = [
+            "-borderwidth", 2,
+            "-highlightthickness", 1,
+            "-highlightcolor", bordercolor,
+            "-background", colors.inputbg,
+            "-foreground", colors.inputfg,
+            "-selectbackground", colors.selectbg,
+            "-selectforeground", colors.selectfg,
+        ]
 
         # set popdown style
         popdown = widget.tk.eval(f"ttk::combobox::PopdownWindow {widget}")
@@ -4705,6 +4951,7 @@ class Bootstyle:
             return ""
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def ttkstyle_widget_type(string):
         """Find and return the widget type.
 
@@ -4776,6 +5023,7 @@ class Bootstyle:
         return widget_orient
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def ttkstyle_widget_color(string):
         """Find and return widget color
 